@@ -1,111 +1,326 @@
 import asyncio
 import websockets
-import subprocess
 import sys
+import os
 import logging
+import logging.handlers
+import queue
 import math
-from typing import List, Tuple, Optional
+import re
+import functools
+from typing import List, Sequence, Tuple, Optional
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; pipe buffers keep their default size
+    fcntl = None
+
+try:
+    import numpy as np
+except ImportError:  # Fall back to computing circle points in pure Python
+    np = None
+
+try:
+    import uvloop
+except ImportError:  # Fall back to the default asyncio event loop
+    uvloop = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-def get_circle_points(n: int, radius: int = 5) -> List[Tuple[int, int, int]]:
+def configure_logging() -> Optional[logging.handlers.QueueListener]:
+    """
+    Configure logging so records are queued on the event loop and stamped and
+    written to stderr by a background listener thread.
+    
+    Like logging.basicConfig, does nothing if the root logger already has handlers.
+    
+    Returns:
+        The started listener to stop on shutdown, or None if logging was already configured
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+        
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+@functools.lru_cache(maxsize=128)
+def _circle_points(n: int, radius: int) -> Tuple[Tuple[int, int, int], ...]:
+    if np is not None:
+        # Angles in radians, starting from top and moving clockwise
+        angles = np.pi / 2 - np.arange(n) * (2 * np.pi / n)
+        xs = np.rint(radius * np.cos(angles)).astype(int).tolist()
+        ys = np.rint(radius * np.sin(angles)).astype(int).tolist()
+        return tuple(zip(ys, [0] * n, xs))
+
+    # Bind lookups to locals and hoist the angle step out of the loop
+    _cos, _sin, _round = math.cos, math.sin, round
+    half_pi = math.pi / 2
+    step = 2 * math.pi / n
+    points = []
+    for i in range(n):
+        # Angle in radians, starting from top and moving clockwise
+        angle = half_pi - i * step
+        x = _round(radius * _cos(angle))
+        y = _round(radius * _sin(angle))
+        points.append((y, 0, x))
+    return tuple(points)
+
+def get_circle_points(n: int, radius: int = 5) -> Tuple[Tuple[int, int, int], ...]:
     """
     Generate points in a circle around the origin.
     
+    Results are cached per (n, radius), so the returned tuple is shared
+    between callers.
+    
     Args:
         n: Number of points to generate
         radius: Radius of the circle
         
     Returns:
-        List of (y, 0, x) coordinates
+        Tuple of (y, 0, x) coordinates
     """
     if n < 1:
         raise ValueError("Number of points must be positive")
     if radius < 1:
         raise ValueError("Radius must be positive")
         
-    points = []
-    for i in range(n):
-        # Angle in radians, starting from top and moving clockwise
-        angle = math.pi / 2 - i * (2 * math.pi / n)
-        x = round(radius * math.cos(angle))
-        y = round(radius * math.sin(angle))
-        points.append((y, 0, x))
-    return points
+    return _circle_points(n, radius)
+
+# Netherite Armor + Tools + Other good stuff given by #godsend
+_GODSEND_COMMANDS: Tuple[str, ...] = (
+    # Netherite Helmet
+    "give RhamzThev netherite_helmet{Enchantments:[{id:protection,lvl:4},{id:respiration,lvl:3},{id:aqua_affinity,lvl:1},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
+
+    # Netherite Chestplate
+    "give RhamzThev netherite_chestplate{Enchantments:[{id:protection,lvl:4},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
+
+    # Netherite Leggings
+    "give RhamzThev netherite_leggings{Enchantments:[{id:protection,lvl:4},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
+
+    # Netherite Boots
+    "give RhamzThev netherite_boots{Enchantments:[{id:protection,lvl:4},{id:feather_falling,lvl:4},{id:depth_strider,lvl:3},{id:soul_speed,lvl:3},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
+
+    # Netherite Sword
+    "give RhamzThev netherite_sword{Enchantments:[{id:sharpness,lvl:5},{id:looting,lvl:3},{id:sweeping,lvl:3},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:fire_aspect,lvl:2},{id:knockback,lvl:2}]} 1",
+
+    # Netherite Axe
+    "give RhamzThev netherite_axe{Enchantments:[{id:sharpness,lvl:5},{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1}]} 1",
+
+    # Netherite Pickaxe
+    "give RhamzThev netherite_pickaxe{Enchantments:[{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:fortune,lvl:3}]} 1",
+
+    # Netherite Shovel
+    "give RhamzThev netherite_shovel{Enchantments:[{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:silk_touch,lvl:1}]} 1",
+
+    # Netherite Hoe
+    "give RhamzThev netherite_hoe{Enchantments:[{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:fortune,lvl:3}]} 1",
+
+    # Bow with Infinity
+    "give RhamzThev bow{Enchantments:[{id:power,lvl:5},{id:unbreaking,lvl:3},{id:infinity,lvl:1},{id:flame,lvl:1}]} 1",
+
+    # Bow with Mending (alternative)
+    "give RhamzThev bow{Enchantments:[{id:power,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:flame,lvl:1}]} 1",
+
+    # Arrows for the Mending bow
+    "give RhamzThev arrow 64",
+)
+
+# Items given alongside the chicken jockey by #jack
+_JACK_ITEMS: Tuple[str, ...] = (
+    "give RhamzThev water_bucket 1",
+    "give RhamzThev flint_and_steel 1",
+    "give RhamzThev crafting_table 1",
+)
+
+# Kills all mobs (Except RhamzThev) for #kill
+_KILL_COMMAND = "kill @e[type=!player]"
+
+# Summon command for one creeper at a (y, 0, x) offset, plus its name tag
+_CREEPER_TEMPLATE = "execute at RhamzThev run summon creeper ~%d ~%d ~%d {powered:1%s}"
+
+_EMPTY_NAME_TAG = ""
+
+def _name_tag(name: Optional[str]) -> str:
+    # CustomName entry appended inside an existing NBT compound
+    return f",CustomName:'\"{name}\"'" if name else _EMPTY_NAME_TAG
+
+def _chaos_name_tag(name: Optional[str]) -> str:
+    # Standalone NBT compound carrying only the CustomName
+    return f"{{CustomName:'\"{name}\"'}}" if name else _EMPTY_NAME_TAG
+
+# "#<command> [<count>] [--name <name>]", arguments in any order
+_COMMAND_RE = re.compile(r"#\s*(\S+)(?:\s+(?:([+-]?\d+)|--name\s+(\S+)))*\s*")
 
 class MinecraftServer:
     def __init__(self):
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.stdin: Optional[asyncio.StreamWriter] = None
+        # Transports wrapping our ends of the stdio pipes, closed on shutdown
+        self.pipe_transports: List[asyncio.BaseTransport] = []
         self.websocket_server = None
-        self.connected_clients = set()
+        # Copy-on-write snapshot, replaced on connect/disconnect so broadcast can iterate it as-is
+        self.connected_clients: Tuple = ()
         self.MAX_CREEPERS = 100
         self.MAX_RADIUS = 20
+        self.MAX_QUEUED_MESSAGES = 1024
+        self.PIPE_BUFFER_SIZE = 1 << 20
+        self.MAX_LINE_LENGTH = 1 << 20
+        # Server output waiting to be broadcast, bounded so a burst applies backpressure to the readers.
+        # Created in start_minecraft_server so it binds to the running event loop
+        self.broadcast_queue: Optional[asyncio.Queue] = None
+        # Keep references to background tasks so they are not garbage collected mid-run
+        self.log_tasks: List[asyncio.Task] = []
+        self.command_handlers = {
+            "creeper": self.handle_creeper,
+            "jack": self.handle_jack,
+            "godsend": self.handle_godsend,
+            "chaos": self.handle_chaos,
+            "kill": self.handle_kill,
+        }
 
     async def start_minecraft_server(self):
         try:
+            # Create the stdio pipes ourselves so they can be resized before the server
+            # starts; uvloop would otherwise hand the child socketpairs
+            stdin_read, stdin_write = os.pipe()
+            stdout_read, stdout_write = os.pipe()
+            stderr_read, stderr_write = os.pipe()
+            for fd in (stdin_write, stdout_read, stderr_read):
+                self.grow_pipe_buffer(fd)
+                
             # Start the Minecraft server process
-            self.process = subprocess.Popen(
-                ['./start.sh'],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
-                universal_newlines=True
+            self.process = await asyncio.create_subprocess_exec(
+                './start.sh',
+                stdin=stdin_read,
+                stdout=stdout_write,
+                stderr=stderr_write
             )
+            # The child holds its own copies of these ends
+            for fd in (stdin_read, stdout_write, stderr_write):
+                os.close(fd)
             logger.info("Minecraft server process started")
             
-            # Start tasks to read process output
-            asyncio.create_task(self.read_process_output(self.process.stdout, "OUT"))
-            asyncio.create_task(self.read_process_output(self.process.stderr, "ERR"))
+            self.stdin = await self.connect_write_pipe(stdin_write)
+            stdout = await self.connect_read_pipe(stdout_read)
+            stderr = await self.connect_read_pipe(stderr_read)
+            
+            # Start tasks to read process output and broadcast it
+            self.broadcast_queue = asyncio.Queue(maxsize=self.MAX_QUEUED_MESSAGES)
+            self.log_tasks = [
+                asyncio.create_task(self.read_process_output(stdout, "OUT")),
+                asyncio.create_task(self.read_process_output(stderr, "ERR")),
+                asyncio.create_task(self.broadcast_queued_messages()),
+            ]
+            for task in self.log_tasks:
+                task.add_done_callback(self.log_task_exception)
         except Exception as e:
             logger.error(f"Failed to start Minecraft server: {e}")
             sys.exit(1)
 
+    async def connect_read_pipe(self, fd: int) -> asyncio.StreamReader:
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=self.MAX_LINE_LENGTH)
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(fd, 'rb', 0))
+        self.pipe_transports.append(transport)
+        return reader
+
+    async def connect_write_pipe(self, fd: int) -> asyncio.StreamWriter:
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, os.fdopen(fd, 'wb', 0))
+        self.pipe_transports.append(transport)
+        return asyncio.StreamWriter(transport, protocol, None, loop)
+
+    @staticmethod
+    def log_task_exception(task: asyncio.Task):
+        # Surface failures of background tasks, which nothing awaits
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task failed: {task.exception()!r}")
+
+    def grow_pipe_buffer(self, fd: int):
+        # Enlarge a stdio pipe (Linux only) so log bursts are read in fewer wakeups
+        if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+            return
+        try:
+            fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, self.PIPE_BUFFER_SIZE)
+        except OSError as e:
+            logger.warning(f"Failed to resize pipe buffer: {e}")
+
     async def read_process_output(self, stream, prefix: str):
         try:
+            skip_rest = False
             while True:
-                line = await asyncio.get_event_loop().run_in_executor(None, stream.readline)
+                try:
+                    line = await stream.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    # EOF: handle any unterminated trailing output
+                    line = e.partial
+                except asyncio.LimitOverrunError as e:
+                    # Line exceeded MAX_LINE_LENGTH: discard it through the next newline and keep draining
+                    if not skip_rest:
+                        logger.warning(f"Dropped [{prefix}] output line longer than {self.MAX_LINE_LENGTH} bytes")
+                    await stream.read(e.consumed)
+                    skip_rest = True
+                    continue
+                if skip_rest:
+                    # Tail of the oversized line
+                    skip_rest = False
+                    continue
                 if not line:
                     break
-                line = line.strip()
+                line = line.decode(errors="replace").strip()
                 if line:
-                    message = f"[{prefix}] {line}"
-                    logger.info(message)
-                    await self.broadcast(message)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("[%s] %s", prefix, line)
+                    if self.connected_clients:
+                        await self.broadcast_queue.put(f"[{prefix}] {line}")
         except Exception as e:
             logger.error(f"Error reading process output: {e}")
 
-    async def broadcast(self, message: str):
+    async def broadcast_queued_messages(self):
+        # Single consumer draining the queue filled by read_process_output
+        while True:
+            message = await self.broadcast_queue.get()
+            self.broadcast(message)
+
+    def broadcast(self, message: str):
+        # Fire-and-forget fanout: the message is UTF-8 encoded once and framed per
+        # client. Connections that are not OPEN are skipped; there is no backpressure,
+        # so frames for a slow client queue in its write buffer until the keepalive
+        # (ping_interval/ping_timeout) times it out
         if self.connected_clients:
             try:
-                await asyncio.gather(
-                    *[client.send(message) for client in self.connected_clients],
-                    return_exceptions=True
-                )
+                websockets.broadcast(self.connected_clients, message)
             except Exception as e:
                 logger.error(f"Error broadcasting message: {e}")
 
-    async def send_command(self, websocket, command):
-        # Handle both single commands and arrays of commands
-        commands = command if isinstance(command, list) else [command]
-        
-        # Send command to Minecraft server process
-        if self.process and self.process.stdin:
+    async def send_one(self, websocket, command: str):
+        # Send a single non-empty command to the Minecraft server process
+        await self._write_commands(websocket, f"{command}\n", f"Command sent: {command}")
+
+    async def send_many(self, websocket, commands: Sequence[str]):
+        # Send a group of non-empty commands with a single write + drain
+        await self._write_commands(
+            websocket,
+            "".join(f"{cmd}\n" for cmd in commands),
+            "\n".join(f"Command sent: {cmd}" for cmd in commands)
+        )
+
+    async def _write_commands(self, websocket, payload: str, ack: str):
+        if self.process and self.stdin:
             try:
-                for cmd in commands:
-                    if cmd:  # Only send non-empty commands
-                        self.process.stdin.write(f"{cmd}\n")
-                        self.process.stdin.flush()
-                        await websocket.send(f"Command sent: {cmd}")
+                self.stdin.write(payload.encode())
+                await self.stdin.drain()
+                await websocket.send(ack)
             except Exception as e:
                 logger.error(f"Failed to send command to Minecraft server: {e}")
-                await websocket.send(f"Error: Failed to send command")
+                await websocket.send("Error: Failed to send command")
         else:
             await websocket.send("Error: Minecraft server not running")
 
@@ -119,33 +334,57 @@ class MinecraftServer:
         Returns:
             Tuple of (command, count, name) where count and name are optional
         """
-        try:
-            parts = message[1:].strip().split()
-            command = parts[0].lower()
+        match = _COMMAND_RE.fullmatch(message)
+        if match is None:
+            logger.error(f"Error parsing command: {message}")
+            raise ValueError("Invalid command format")
+        
+        command, count, name = match.groups()
+        return command.lower(), int(count) if count is not None else None, name
+
+    async def handle_creeper(self, websocket, count: Optional[int], name: Optional[str]):
+        # Default to 4 creepers if no count specified
+        if count is None:
+            count = 4
             
-            count = None
-            name = None
+        if count > self.MAX_CREEPERS:
+            await websocket.send(f"Error: Maximum {self.MAX_CREEPERS} creepers allowed")
+            return
             
-            # Parse remaining arguments
-            i = 1
-            while i < len(parts):
-                if parts[i] == "--name" and i + 1 < len(parts):
-                    name = parts[i + 1]
-                    i += 2
-                else:
-                    try:
-                        count = int(parts[i])
-                        i += 1
-                    except ValueError:
-                        raise ValueError(f"Invalid argument: {parts[i]}")
-            
-            return command, count, name
-        except (ValueError, IndexError) as e:
-            logger.error(f"Error parsing command: {e}")
-            raise ValueError("Invalid command format")
+        # surround player with {count} creepers
+        points = get_circle_points(count)
+        name_tag = _name_tag(name)
+        commands = [_CREEPER_TEMPLATE % (y, z, x, name_tag) for (y, z, x) in points]
+        await self.send_many(websocket, commands)
+
+    async def handle_jack(self, websocket, count: Optional[int], name: Optional[str]):
+        # Spawn a Chicken Jockey, a Water Bucket, a Flint and Steel, and a Crafting Table
+        name_tag = _name_tag(name)
+        await self.send_many(websocket, [
+            # Spawn chicken jockey 3 blocks in front of player
+            f"execute at RhamzThev run summon chicken ~3 ~ ~ {{Passengers:[{{id:\"zombie\",IsBaby:1{name_tag}}}]}}",
+            # Give items to player
+            *_JACK_ITEMS
+        ])
+
+    async def handle_godsend(self, websocket, count: Optional[int], name: Optional[str]):
+        # Spawn Netherite Armor + Tools + Other good stuff
+        await self.send_many(websocket, _GODSEND_COMMANDS)
+
+    async def handle_chaos(self, websocket, count: Optional[int], name: Optional[str]):
+        # Spawn Wither and Ender Dragon
+        name_tag = _chaos_name_tag(name)
+        await self.send_many(websocket, [
+            f"execute at RhamzThev run summon wither ~10 ~ ~ {name_tag}",
+            f"execute at RhamzThev run summon ender_dragon ~10 ~ ~ {name_tag}"
+        ])
+
+    async def handle_kill(self, websocket, count: Optional[int], name: Optional[str]):
+        # Kills all mobs (Except RhamzThev)
+        await self.send_one(websocket, _KILL_COMMAND)
 
     async def handle_websocket(self, websocket):
-        self.connected_clients.add(websocket)
+        self.connected_clients = self.connected_clients + (websocket,)
         try:
             async for message in websocket:
                 if message.startswith('#'):
@@ -153,88 +392,11 @@ class MinecraftServer:
                         command, count, name = self.parse_command(message)
                         logger.info(f"Received command: {command} {count if count is not None else ''} {f'--name {name}' if name else ''}")
                         
-                        if command == "creeper":
-                            # Default to 4 creepers if no count specified
-                            if count is None:
-                                count = 4
-                                
-                            if count > self.MAX_CREEPERS:
-                                await websocket.send(f"Error: Maximum {self.MAX_CREEPERS} creepers allowed")
-                                continue
-                                
-                            # surround player with {count} creepers
-                            points = get_circle_points(count)
-                            name_tag = f",CustomName:'\"{name}\"'" if name else ""
-                            commands = [f"execute at RhamzThev run summon creeper ~{point[0]} ~{point[1]} ~{point[2]} {{powered:1{name_tag}}}" for point in points]
-                            await self.send_command(websocket, commands)
-                            
-                        elif command == "jack":
-                            # Spawn a Chicken Jockey, a Water Bucket, a Flint and Steel, and a Crafting Table
-                            name_tag = f",CustomName:'\"{name}\"'" if name else ""
-                            await self.send_command(websocket, [
-                                # Spawn chicken jockey 3 blocks in front of player
-                                f"execute at RhamzThev run summon chicken ~3 ~ ~ {{Passengers:[{{id:\"zombie\",IsBaby:1{name_tag}}}]}}",
-                                # Give items to player
-                                "give RhamzThev water_bucket 1",
-                                "give RhamzThev flint_and_steel 1",
-                                "give RhamzThev crafting_table 1"
-                            ])
-                            
-                        elif command == "godsend":
-                            # Spawn Netherite Armor + Tools + Other good stuff
-                            await self.send_command(websocket, [
-                                # Netherite Helmet
-                                "give RhamzThev netherite_helmet{Enchantments:[{id:protection,lvl:4},{id:respiration,lvl:3},{id:aqua_affinity,lvl:1},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
-                                
-                                # Netherite Chestplate
-                                "give RhamzThev netherite_chestplate{Enchantments:[{id:protection,lvl:4},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
-                                
-                                # Netherite Leggings
-                                "give RhamzThev netherite_leggings{Enchantments:[{id:protection,lvl:4},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
-                                
-                                # Netherite Boots
-                                "give RhamzThev netherite_boots{Enchantments:[{id:protection,lvl:4},{id:feather_falling,lvl:4},{id:depth_strider,lvl:3},{id:soul_speed,lvl:3},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:thorns,lvl:3}]} 1",
-                                
-                                # Netherite Sword
-                                "give RhamzThev netherite_sword{Enchantments:[{id:sharpness,lvl:5},{id:looting,lvl:3},{id:sweeping,lvl:3},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:fire_aspect,lvl:2},{id:knockback,lvl:2}]} 1",
-                                
-                                # Netherite Axe
-                                "give RhamzThev netherite_axe{Enchantments:[{id:sharpness,lvl:5},{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1}]} 1",
-                                
-                                # Netherite Pickaxe
-                                "give RhamzThev netherite_pickaxe{Enchantments:[{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:fortune,lvl:3}]} 1",
-                                
-                                # Netherite Shovel
-                                "give RhamzThev netherite_shovel{Enchantments:[{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:silk_touch,lvl:1}]} 1",
-                                
-                                # Netherite Hoe
-                                "give RhamzThev netherite_hoe{Enchantments:[{id:efficiency,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:fortune,lvl:3}]} 1",
-                                
-                                # Bow with Infinity
-                                "give RhamzThev bow{Enchantments:[{id:power,lvl:5},{id:unbreaking,lvl:3},{id:infinity,lvl:1},{id:flame,lvl:1}]} 1",
-                                
-                                # Bow with Mending (alternative)
-                                "give RhamzThev bow{Enchantments:[{id:power,lvl:5},{id:unbreaking,lvl:3},{id:mending,lvl:1},{id:flame,lvl:1}]} 1",
-                                
-                                # Arrows for the Mending bow
-                                "give RhamzThev arrow 64"
-                            ])
-                            
-                        elif command == "chaos":
-                            # Spawn Wither and Ender Dragon
-                            name_tag = f"{{CustomName:'\"{name}\"'}}" if name else ""
-                            await self.send_command(websocket, [
-                                f"execute at RhamzThev run summon wither ~10 ~ ~ {name_tag}",
-                                f"execute at RhamzThev run summon ender_dragon ~10 ~ ~ {name_tag}"
-                            ])
-                        elif command == "kill":
-                            # Kills all mobs (Except RhamzThev)
-                            await self.send_command(websocket, [
-                                # Kill all non-player entities
-                                "kill @e[type=!player]",
-                            ])
-                        else:
+                        handler = self.command_handlers.get(command)
+                        if handler is None:
                             await websocket.send(f"Error: Unknown command '{command}'")
+                        else:
+                            await handler(websocket, count, name)
                             
                     except ValueError as e:
                         await websocket.send(f"Error: {str(e)}")
@@ -248,31 +410,46 @@ class MinecraftServer:
         except Exception as e:
             logger.error(f"Error handling WebSocket connection: {e}")
         finally:
-            self.connected_clients.remove(websocket)
+            self.connected_clients = tuple(client for client in self.connected_clients if client is not websocket)
 
     async def start_websocket_server(self):
         self.websocket_server = await websockets.serve(
             self.handle_websocket,
             "localhost",
-            8765
+            8765,
+            # Log lines are small and the server is local; skip permessage-deflate
+            compression=None
         )
         logger.info("WebSocket server started on ws://localhost:8765")
 
     async def run(self):
-        # Start the Minecraft server
-        await self.start_minecraft_server()
-        
-        # Start the WebSocket server
-        await self.start_websocket_server()
-        
-        # Keep the server running
-        await self.websocket_server.wait_closed()
+        try:
+            # Start the Minecraft server
+            await self.start_minecraft_server()
+            
+            # Start the WebSocket server
+            await self.start_websocket_server()
+            
+            # Keep the server running
+            await self.websocket_server.wait_closed()
+        finally:
+            # Stop the Minecraft server while the event loop is still running
+            if self.process and self.process.returncode is None:
+                self.process.terminate()
+                await self.process.wait()
+            for transport in self.pipe_transports:
+                transport.close()
 
 if __name__ == "__main__":
+    log_listener = configure_logging()
     server = MinecraftServer()
     try:
-        asyncio.run(server.run())
+        if uvloop is not None:
+            uvloop.run(server.run())
+        else:
+            asyncio.run(server.run())
     except KeyboardInterrupt:
         logger.info("Shutting down...")
-        if server.process:
-            server.process.terminate()
+    finally:
+        if log_listener is not None:
+            log_listener.stop()